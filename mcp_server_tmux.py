@@ -9,11 +9,12 @@ agent coordination, and real-time monitoring.
 import json
 import sys
 import subprocess
+import time
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import socket
 import threading
 import argparse
 
@@ -22,25 +23,64 @@ sys.path.append(str(Path(__file__).parent))
 from tmux_utils import TmuxOrchestrator
 from tools.message_bus import MessageBus
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Response timestamps are second-granularity; formatting one per second
+# beats a datetime.now().isoformat() call on every response field
+_ts_cache = [0, ""]
+
+def _now_iso() -> str:
+    """Current ISO timestamp, cached within the same second"""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[0] = now
+        _ts_cache[1] = datetime.fromtimestamp(now).isoformat()
+    return _ts_cache[1]
+
+def _json_loads(data):
+    """Parse JSON bytes, preferring orjson when installed"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps_line(obj) -> bytes:
+    """Serialize one newline-terminated JSON response as bytes"""
+    if orjson:
+        return orjson.dumps(obj) + b'\n'
+    return (json.dumps(obj) + '\n').encode('utf-8')
+
 class TmuxMCPServer:
     """MCP Server for Tmux Orchestrator Management"""
-    
+
+    # Shared across instances so the list-sessions subprocess runs once per process
+    _existing_sessions_cache = None
+
     def __init__(self):
         self.orchestrator = TmuxOrchestrator()
         self.message_bus = MessageBus()
-        self._existing_sessions = set()
+        self._existing_sessions = frozenset()
+        # One instance is shared across client threads; serialize mutations
+        self._lock = threading.Lock()
         self._preserve_existing_sessions()
-    
+
     def _preserve_existing_sessions(self):
         """Track existing sessions to prevent accidental closure"""
+        if TmuxMCPServer._existing_sessions_cache is not None:
+            self._existing_sessions = TmuxMCPServer._existing_sessions_cache
+            return
+        names = set()
         try:
-            result = subprocess.run(["tmux", "list-sessions", "-F", "#{session_name}"], 
+            result = subprocess.run(["tmux", "list-sessions", "-F", "#{session_name}"],
                                   capture_output=True, text=True, check=True)
             for session in result.stdout.strip().split('\n'):
                 if session:
-                    self._existing_sessions.add(session)
+                    names.add(session)
         except:
             pass
+        # Immutable snapshot - shared between instances without copying
+        self._existing_sessions = frozenset(names)
+        TmuxMCPServer._existing_sessions_cache = self._existing_sessions
         
     def list_sessions(self) -> Dict[str, Any]:
         """List all tmux sessions with detailed window information"""
@@ -61,7 +101,7 @@ class TmuxMCPServer:
                 }
                 for session in sessions
             ],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     
     def get_window_content(self, session_name: str, window_index: int, lines: int = 50) -> Dict[str, Any]:
@@ -72,7 +112,7 @@ class TmuxMCPServer:
             "window": window_index,
             "content": content,
             "lines_captured": len(content.split('\n')) if content else 0,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     
     def send_to_window(self, session_name: str, window_index: int, command: str, 
@@ -86,7 +126,7 @@ class TmuxMCPServer:
             "session": session_name,
             "window": window_index,
             "command": command,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     
     def get_agency_status(self) -> Dict[str, Any]:
@@ -99,11 +139,11 @@ class TmuxMCPServer:
                 "agencies": agencies.get("agencies", []),
                 "message_queue_stats": self._get_queue_stats(),
                 "tmux_snapshot": self.orchestrator.create_monitoring_snapshot(),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
             return status
         except Exception as e:
-            return {"error": str(e), "timestamp": datetime.now().isoformat()}
+            return {"error": str(e), "timestamp": _now_iso()}
     
     def send_agency_message(self, from_agency: str, to_agency: str, 
                            msg_type: str, payload: Dict) -> Dict[str, Any]:
@@ -116,7 +156,7 @@ class TmuxMCPServer:
                 "from": from_agency,
                 "to": to_agency,
                 "type": msg_type,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -128,45 +168,57 @@ class TmuxMCPServer:
             "agency": agency,
             "pending_count": len(messages),
             "messages": messages,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     
     def create_agency_session(self, agency_name: str, agents: List[str]) -> Dict[str, Any]:
         """Create new tmux session for an agency with agent panels"""
+        with self._lock:
+            return self._create_agency_session(agency_name, agents)
+
+    def _create_agency_session(self, agency_name: str, agents: List[str]) -> Dict[str, Any]:
         try:
-            # Check if session already exists - preserve it
-            result = subprocess.run(["tmux", "has-session", "-t", agency_name], 
-                                  capture_output=True)
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "agency": agency_name,
-                    "agents": agents,
-                    "session_existed": True,
-                    "preserved": True,
-                    "timestamp": datetime.now().isoformat()
-                }
-            
-            # Create main agency session
-            session_cmd = f"tmux new-session -d -s {agency_name}"
-            subprocess.run(session_cmd, shell=True, check=True)
-            
-            # Create windows for each agent
+            # Create atomically: a duplicate-session error tells us the
+            # session already existed, with no has-session probe and no
+            # window between check and create for the session to vanish
+            result = subprocess.run(["tmux", "new-session", "-d", "-s", agency_name],
+                                  capture_output=True, text=True)
+            if result.returncode != 0:
+                if "duplicate session" in result.stderr:
+                    return {
+                        "success": True,
+                        "agency": agency_name,
+                        "agents": agents,
+                        "session_existed": True,
+                        "preserved": True,
+                        "timestamp": _now_iso()
+                    }
+                raise subprocess.CalledProcessError(
+                    result.returncode, result.args, output=result.stdout,
+                    stderr=result.stderr
+                )
+            self._existing_sessions = self._existing_sessions | {agency_name}
+
+            # Create windows for each agent in one batched tmux invocation
+            window_argv = ["tmux"]
             for i, agent in enumerate(agents):
+                if i > 0:
+                    window_argv.append(";")
                 if i == 0:
                     # First agent uses main window
-                    window_cmd = f"tmux rename-window -t {agency_name}:0 '{agent}'"
+                    window_argv.extend(["rename-window", "-t", f"{agency_name}:0", agent])
                 else:
                     # Create new window for additional agents
-                    window_cmd = f"tmux new-window -t {agency_name} -n '{agent}'"
-                subprocess.run(window_cmd, shell=True, check=True)
+                    window_argv.extend(["new-window", "-t", agency_name, "-n", agent])
+            if agents:
+                subprocess.run(window_argv, check=True)
             
             return {
                 "success": True,
                 "agency": agency_name,
                 "agents": agents,
                 "session_created": True,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -174,13 +226,12 @@ class TmuxMCPServer:
     def switch_to_session(self, session_name: str) -> Dict[str, Any]:
         """Switch to specific tmux session"""
         try:
-            cmd = f"tmux attach-session -t {session_name}"
-            subprocess.run(cmd, shell=True, check=True)
+            subprocess.run(["tmux", "attach-session", "-t", session_name], check=True)
             return {
                 "success": True,
                 "session": session_name,
                 "action": "attached",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -188,62 +239,65 @@ class TmuxMCPServer:
     def _get_queue_stats(self) -> Dict[str, Any]:
         """Get message queue statistics"""
         try:
-            queue = self.message_bus._load_queue()
-            pending = len([m for m in queue["messages"] if m["status"] == "pending"])
-            delivered = len([m for m in queue["messages"] if m["status"] == "delivered"])
-            acknowledged = len([m for m in queue["messages"] if m["status"] == "acknowledged"])
-            
-            return {
-                "total_messages": len(queue["messages"]),
-                "pending": pending,
-                "delivered": delivered,
-                "acknowledged": acknowledged,
-                "last_updated": queue.get("last_updated")
-            }
+            # Single indexed GROUP BY in SQLite - no file re-parse
+            return self.message_bus.queue_stats()
         except Exception:
             return {"error": "Could not load queue stats"}
 
-def handle_mcp_request(request: Dict[str, Any]) -> Dict[str, Any]:
-    """Handle MCP protocol requests"""
-    server = TmuxMCPServer()
-    
+# Method dispatch table: O(1) hash lookup instead of a linear if/elif
+# chain. Each entry pairs a precompiled param extractor with the unbound
+# server method, so argument validation is one tuple-building call and a
+# missing param surfaces as -32602 before the method runs.
+METHODS = {
+    "tmux/list_sessions":
+        (lambda p: (), TmuxMCPServer.list_sessions),
+    "tmux/get_window_content":
+        (lambda p: (p["session"], p["window"], p.get("lines", 50)),
+         TmuxMCPServer.get_window_content),
+    "tmux/send_to_window":
+        (lambda p: (p["session"], p["window"], p["command"], p.get("confirm", False)),
+         TmuxMCPServer.send_to_window),
+    "tmux/get_agency_status":
+        (lambda p: (), TmuxMCPServer.get_agency_status),
+    "tmux/send_agency_message":
+        (lambda p: (p["from"], p["to"], p["type"], p["payload"]),
+         TmuxMCPServer.send_agency_message),
+    "tmux/get_pending_messages":
+        (lambda p: (p["agency"],), TmuxMCPServer.get_pending_messages),
+    "tmux/create_agency_session":
+        (lambda p: (p["agency"], p["agents"]), TmuxMCPServer.create_agency_session),
+    "tmux/switch_to_session":
+        (lambda p: (p["session"],), TmuxMCPServer.switch_to_session),
+}
+
+def handle_mcp_request(request: Dict[str, Any], server: TmuxMCPServer) -> Dict[str, Any]:
+    """Handle MCP protocol requests against a shared server instance"""
     method = request.get("method")
     params = request.get("params", {})
     request_id = request.get("id")
-    
+
     try:
-        if method == "tmux/list_sessions":
-            result = server.list_sessions()
-        elif method == "tmux/get_window_content":
-            result = server.get_window_content(
-                params["session"], params["window"], params.get("lines", 50)
-            )
-        elif method == "tmux/send_to_window":
-            result = server.send_to_window(
-                params["session"], params["window"], params["command"], 
-                params.get("confirm", False)
-            )
-        elif method == "tmux/get_agency_status":
-            result = server.get_agency_status()
-        elif method == "tmux/send_agency_message":
-            result = server.send_agency_message(
-                params["from"], params["to"], params["type"], params["payload"]
-            )
-        elif method == "tmux/get_pending_messages":
-            result = server.get_pending_messages(params["agency"])
-        elif method == "tmux/create_agency_session":
-            result = server.create_agency_session(params["agency"], params["agents"])
-        elif method == "tmux/switch_to_session":
-            result = server.switch_to_session(params["session"])
-        else:
+        entry = METHODS.get(method)
+        if entry is None:
             result = {"error": f"Unknown method: {method}"}
-        
+        else:
+            extract, invoke = entry
+            try:
+                args = extract(params)
+            except (KeyError, TypeError):
+                return {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "error": {"code": -32602, "message": f"Invalid params for {method}"}
+                }
+            result = invoke(server, *args)
+
         return {
             "jsonrpc": "2.0",
             "id": request_id,
             "result": result
         }
-    
+
     except Exception as e:
         return {
             "jsonrpc": "2.0",
@@ -259,6 +313,10 @@ def main():
 
     print("Tmux Orchestrator MCP Server starting...", file=sys.stderr)
 
+    # Construct once; per-request construction re-ran _preserve_existing_sessions
+    # (a subprocess) and re-loaded the message bus on every call
+    mcp_server = TmuxMCPServer()
+
     if args.socket:
         sock_path = args.socket
 
@@ -268,54 +326,65 @@ def main():
         except Exception:
             pass
 
-        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        server.bind(sock_path)
-        server.listen(5)
-
-        def handle_client(conn):
-            with conn:
-                data = b''
-                while True:
-                    chunk = conn.recv(4096)
-                    if not chunk:
-                        break
-                    data += chunk
-                    # process lines
-                    while b'\n' in data:
-                        line, data = data.split(b'\n', 1)
-                        line = line.strip()
-                        if not line:
-                            continue
-                        try:
-                            request = json.loads(line.decode('utf-8'))
-                            response = handle_mcp_request(request)
-                        except Exception as e:
-                            response = {
-                                "jsonrpc": "2.0",
-                                "id": request.get('id') if isinstance(request, dict) else None,
-                                "error": {"code": -32603, "message": str(e)}
-                            }
-                        try:
-                            conn.sendall((json.dumps(response) + '\n').encode('utf-8'))
-                        except Exception:
-                            return
+        async def serve(path):
+            loop = asyncio.get_running_loop()
+            # Request handling runs on a small fixed pool instead of the
+            # default executor, which sizes itself from the CPU count and
+            # would keep more idle thread stacks around than this
+            # subprocess-bound workload ever needs
+            loop.set_default_executor(ThreadPoolExecutor(
+                max_workers=8, thread_name_prefix="mcp-worker"
+            ))
+            # Cap concurrent tmux subprocess work across all clients
+            tmux_limit = asyncio.Semaphore(8)
 
-        def accept_loop():
-            try:
-                while True:
-                    conn, _ = server.accept()
-                    t = threading.Thread(target=handle_client, args=(conn,))
-                    t.daemon = True
-                    t.start()
-            finally:
+            async def handle(reader, writer):
+                # bytearray buffer extends in place; bytes += would copy
+                # the whole accumulated buffer on every chunk
+                buffer = bytearray()
+                # Responses coalesce here and flush once per input chunk,
+                # one write instead of one syscall per response
+                outbuf = bytearray()
                 try:
-                    server.close()
-                except Exception:
+                    while True:
+                        chunk = await reader.read(65536)
+                        if not chunk:
+                            break
+                        buffer.extend(chunk)
+                        while (newline := buffer.find(b'\n')) != -1:
+                            line = bytes(buffer[:newline]).strip()
+                            del buffer[:newline + 1]
+                            if not line:
+                                continue
+                            try:
+                                request = _json_loads(line)
+                                async with tmux_limit:
+                                    response = await loop.run_in_executor(
+                                        None, handle_mcp_request, request, mcp_server
+                                    )
+                            except Exception as e:
+                                response = {
+                                    "jsonrpc": "2.0",
+                                    "id": request.get('id') if isinstance(request, dict) else None,
+                                    "error": {"code": -32603, "message": str(e)}
+                                }
+                            outbuf += _json_dumps_line(response)
+                        if outbuf:
+                            writer.write(bytes(outbuf))
+                            outbuf.clear()
+                            await writer.drain()
+                except (ConnectionResetError, BrokenPipeError):
                     pass
+                finally:
+                    writer.close()
+
+            server = await asyncio.start_unix_server(handle, path=path)
+            print(f"MCP socket listening on {path}", file=sys.stderr)
+            async with server:
+                await server.serve_forever()
 
-        print(f"MCP socket listening on {sock_path}", file=sys.stderr)
         try:
-            accept_loop()
+            asyncio.run(serve(sock_path))
         except KeyboardInterrupt:
             pass
         return
@@ -324,7 +393,7 @@ def main():
     for line in sys.stdin:
         try:
             request = json.loads(line.strip())
-            response = handle_mcp_request(request)
+            response = handle_mcp_request(request, mcp_server)
             print(json.dumps(response), flush=True)
         except json.JSONDecodeError:
             error_response = {
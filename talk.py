@@ -7,10 +7,17 @@ Usage: python3 talk.py <session:window> <message>
 
 import sys
 import subprocess
-import time
 import json
 from pathlib import Path
 
+def _tmux(*args):
+    """Run a tmux command in argv form with captured text output
+
+    close_fds=False keeps subprocess on the posix_spawn fast path
+    """
+    return subprocess.run(('tmux',) + args, capture_output=True, text=True,
+                          close_fds=False)
+
 def send_message(target, message):
     """Send message to tmux window"""
     # If target is just a session name, assume window 0
@@ -18,19 +25,13 @@ def send_message(target, message):
         target = f"{target}:0"
 
     try:
-        # Send the message
-        subprocess.run(
-            ['tmux', 'send-keys', '-t', target, message],
-            check=True,
-            capture_output=True
-        )
-
-        # Wait for UI to register
-        time.sleep(0.5)
-
-        # Send Enter
+        # One invocation delivers the message (literally, so tmux key
+        # names in the text are not interpreted) and the Enter key.
+        # tmux queues the keys in order - no settle delay needed.
         subprocess.run(
-            ['tmux', 'send-keys', '-t', target, 'Enter'],
+            ['tmux',
+             'send-keys', '-l', '-t', target, '--', message,
+             ';', 'send-keys', '-t', target, 'Enter'],
             check=True,
             capture_output=True
         )
@@ -45,22 +46,14 @@ def send_message(target, message):
 def check_session(session_name):
     """Check if tmux session exists"""
     try:
-        result = subprocess.run(
-            ['tmux', 'has-session', '-t', session_name],
-            capture_output=True
-        )
-        return result.returncode == 0
+        return _tmux('has-session', '-t', session_name).returncode == 0
     except Exception:
         return False
 
 def list_sessions():
     """List all tmux sessions"""
     try:
-        result = subprocess.run(
-            ['tmux', 'ls'],
-            capture_output=True,
-            text=True
-        )
+        result = _tmux('ls')
         if result.returncode == 0:
             return result.stdout.strip()
         return "No sessions running"
@@ -73,15 +66,12 @@ def peek_window(target, lines=30):
         target = f"{target}:0"
 
     try:
-        result = subprocess.run(
-            ['tmux', 'capture-pane', '-t', target, '-p'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        output = result.stdout.strip().split('\n')
-        # Return last N lines
-        return '\n'.join(output[-lines:])
+        # tmux trims to the last N lines itself - no transferring the
+        # whole scrollback just to slice it here
+        result = _tmux('capture-pane', '-t', target, '-p', '-S', f'-{lines}')
+        if result.returncode != 0:
+            return f"Error: {result.stderr.strip()}"
+        return result.stdout.rstrip('\n')
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -18,6 +18,8 @@ import sys
 import json
 import time
 import argparse
+import functools
+import shlex
 import subprocess
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -28,6 +30,25 @@ except Exception:
     requests = None
 
 
+def _flag(key, value) -> List[str]:
+    """Render one --option for a CLI command"""
+    if isinstance(value, bool):
+        return [f'--{key}'] if value else []
+    if value is not None:
+        return [f'--{key}', str(value)]
+    return []
+
+
+def _build_cli(base: List[str], command: Optional[str], options: Dict, args: List[str]) -> str:
+    """Assemble a provider CLI command string from its parts"""
+    parts = list(base)
+    if command:
+        parts.append(command)
+    parts.extend(f for key, value in options.items() for f in _flag(key, value))
+    parts.extend(args)
+    return ' '.join(p for p in parts if p)
+
+
 class TmuxOrchestrator:
     def __init__(self, session_name: str, config: Dict):
         self.session_name = session_name
@@ -37,13 +58,16 @@ class TmuxOrchestrator:
         self.default_provider = config.get('default_provider', 'opencode')
 
     def run_command(self, cmd: List[str], cwd: Optional[str] = None) -> subprocess.CompletedProcess:
-        """Run a command and return the result"""
-        return subprocess.run(
-            cmd,
-            cwd=cwd or str(self.project_root),
-            capture_output=True,
-            text=True
-        )
+        """Run a command and return the result
+
+        No cwd and close_fds=False unless a caller asks otherwise: these
+        are the conditions under which CPython spawns via posix_spawn
+        instead of a full fork, which matters for the many small tmux
+        invocations this class makes. tmux commands are cwd-independent.
+        """
+        if cwd is not None:
+            return subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+        return subprocess.run(cmd, capture_output=True, text=True, close_fds=False)
 
     def session_exists(self) -> bool:
         """Check if tmux session exists"""
@@ -86,108 +110,118 @@ class TmuxOrchestrator:
         panes = window.get('panes', [])
         window_target = f'{self.session_name}:{window_index}'
 
+        # Accumulate split-window/send-keys operations and dispatch them in
+        # one tmux invocation instead of one fork (plus a 0.1s sleep) each
+        ops: List[List[str]] = []
+
         # Create additional panes (first pane already exists)
         for i in range(1, len(panes)):
             split_dir = '-h' if panes[i].get('split', 'horizontal') == 'vertical' else '-v'
-            self.run_command([
-                'tmux', 'split-window', split_dir,
-                '-t', window_target
-            ])
+            ops.append(['split-window', split_dir, '-t', window_target])
 
-        # Send commands to each pane
+        # Queue commands for each pane
         for i, pane_config in enumerate(panes):
             pane_target = f'{window_target}.{i}'
             commands = pane_config.get('commands', [])
 
-            # Send each command with optional delay
             for cmd in commands:
                 if isinstance(cmd, dict):
                     # Handle provider-specific commands
                     if 'provider' in cmd:
                         provider = cmd['provider']
                         if provider == 'ollama':
-                            self.send_ollama_command(pane_target, cmd.get('ollama', {}))
+                            command = self.build_ollama_command(cmd.get('ollama', {}))
                         elif provider == 'ollama-cloud':
-                            self.send_ollama_cloud_command(pane_target, cmd.get('ollama-cloud', {}))
+                            command = self.build_ollama_cloud_command(cmd.get('ollama-cloud', {}))
                         elif provider == 'opencode':
-                            self.send_opencode_command(pane_target, cmd.get('opencode', {}))
+                            command = self.build_opencode_command(cmd.get('opencode', {}))
                         else:
                             print(f"Unknown provider: {provider}")
+                            command = None
+                        if command:
+                            ops.append(self._send_keys_ops(pane_target, command))
                     else:
                         # Plain command object with 'command'
                         if 'command' in cmd:
-                            self.send_command(pane_target, cmd['command'])
+                            ops.append(self._send_keys_ops(pane_target, cmd['command']))
                         if 'delay' in cmd:
+                            # Explicit delays still honored: flush what we
+                            # have so the commands run before the wait
+                            self._flush_tmux_ops(ops)
+                            ops = []
                             time.sleep(cmd['delay'])
                 else:
-                    self.send_command(pane_target, cmd)
-                    time.sleep(0.1)  # Small delay between commands
+                    ops.append(self._send_keys_ops(pane_target, cmd))
 
-    def send_command(self, pane_target: str, command: str) -> None:
-        """Send command to specific pane"""
-        self.run_command([
-            'tmux', 'send-keys',
-            '-t', pane_target,
-            command, 'Enter'
-        ])
+        self._flush_tmux_ops(ops)
 
-    def send_opencode_command(self, pane_target: str, oc_config: Dict) -> None:
-        """Send opencode CLI command to pane"""
-        # Build opencode command with global and local options
-        cmd_parts = ['opencode']
-
-        # Add global opencode options
+    def _flush_tmux_ops(self, ops: List[List[str]]) -> None:
+        """Run accumulated tmux operations as one ';'-separated invocation"""
+        if not ops:
+            return
+        argv = ['tmux']
+        for i, op in enumerate(ops):
+            if i:
+                argv.append(';')
+            argv.extend(op)
+        self.run_command(argv)
+
+    def send_command(self, pane_target: str, command) -> None:
+        """Send command to specific pane
+
+        The payload goes out with send-keys -l so text matching tmux key
+        names is not translated; Enter is sent as a real key in the same
+        invocation. List payloads are shell-quoted for the pane's shell.
+        """
+        self.run_command(['tmux'] + self._send_keys_ops(pane_target, command))
+
+    @staticmethod
+    def _send_keys_ops(pane_target: str, command) -> List[str]:
+        """Build the literal-send + Enter operation pair for one command"""
+        if isinstance(command, list):
+            command = shlex.join(command)
+        return [
+            'send-keys', '-l', '-t', pane_target, '--', command,
+            ';', 'send-keys', '-t', pane_target, 'Enter'
+        ]
+
+    def build_opencode_command(self, oc_config: Dict) -> str:
+        """Build opencode CLI command string"""
+        # Global options keep their literal '--key value' form
+        base = ['opencode']
         global_opts = self.providers.get('opencode', {}).get('global_options', {})
         for key, value in global_opts.items():
-            cmd_parts.extend([f'--{key}', str(value)])
+            base.extend([f'--{key}', str(value)])
 
-        # Add command-specific options
-        cmd_parts.append(oc_config.get('command', ''))
-
-        cmd_opts = oc_config.get('options', {})
-        for key, value in cmd_opts.items():
-            if isinstance(value, bool) and value:
-                cmd_parts.append(f'--{key}')
-            elif value is not None:
-                cmd_parts.extend([f'--{key}', str(value)])
-
-        # Add arguments
-        cmd_parts.extend(oc_config.get('args', []))
-
-        # Send command
-        self.send_command(pane_target, ' '.join([p for p in cmd_parts if p]))
+        return _build_cli(
+            base,
+            oc_config.get('command', ''),
+            oc_config.get('options', {}),
+            oc_config.get('args', [])
+        )
 
-    def send_ollama_command(self, pane_target: str, ollama_config: Dict) -> None:
-        """Send Ollama CLI command to pane"""
-        cmd_parts = ['ollama']
+    def build_ollama_command(self, ollama_config: Dict) -> str:
+        """Build Ollama CLI command string"""
+        base = ['ollama']
 
         # Add command
         if 'command' in ollama_config:
-            cmd_parts.append(ollama_config['command'])
+            base.append(ollama_config['command'])
 
         # Add model if specified
         if 'model' in ollama_config:
-            cmd_parts.append(ollama_config['model'])
+            base.append(ollama_config['model'])
 
         # Add prompt/file if specified
         if 'prompt' in ollama_config:
-            cmd_parts.extend(['--prompt', ollama_config['prompt']])
+            base.extend(['--prompt', ollama_config['prompt']])
         elif 'file' in ollama_config:
-            cmd_parts.extend(['--file', ollama_config['file']])
-
-        # Add other options
-        options = ollama_config.get('options', {})
-        for key, value in options.items():
-            if isinstance(value, bool) and value:
-                cmd_parts.append(f'--{key}')
-            elif value is not None:
-                cmd_parts.extend([f'--{key}', str(value)])
+            base.extend(['--file', ollama_config['file']])
 
-        # Send command
-        self.send_command(pane_target, ' '.join(cmd_parts))
+        return _build_cli(base, None, ollama_config.get('options', {}), [])
 
-    def send_ollama_cloud_command(self, pane_target: str, cloud_config: Dict) -> None:
-        """Send Ollama Cloud API command to pane (via curl)"""
+    def build_ollama_cloud_command(self, cloud_config: Dict) -> Optional[str]:
+        """Build Ollama Cloud API command string (via curl)"""
         # Get provider config
         provider_config = self.providers.get('ollama-cloud', {})
         api_key = provider_config.get('api_key') or os.getenv('OLLAMA_CLOUD_API_KEY')
@@ -195,7 +229,7 @@ class TmuxOrchestrator:
 
         if not api_key:
             print("Ollama Cloud API key not found")
-            return
+            return None
 
         # Build curl command for API call
         cmd_parts = ['curl', '-s', '-X', 'POST']
@@ -217,8 +251,7 @@ class TmuxOrchestrator:
         cmd_parts.extend(['-d', json.dumps(data)])
         cmd_parts.append(f"{base_url}/generate")
 
-        # Send command
-        self.send_command(pane_target, ' '.join(cmd_parts))
+        return ' '.join(cmd_parts)
 
     def attach_session(self) -> None:
         """Attach to the tmux session"""
@@ -235,14 +268,29 @@ class TmuxOrchestrator:
             print(f"Killed session: {self.session_name}")
 
 
-def load_config(config_path: str) -> Dict:
-    """Load configuration from JSON file"""
+def load_config(config_path: str):
+    """Load configuration from JSON file
+
+    Returns (config, providers_used) - the set of provider names referenced
+    by pane commands, indexed once here so startup checks are set lookups
+    rather than stringifying every window dict.
+    """
     with open(config_path, 'r') as f:
-        return json.load(f)
+        config = json.load(f)
+
+    providers_used = set()
+    for window in config.get('windows', []):
+        for pane in window.get('panes', []):
+            for cmd in pane.get('commands', []):
+                if isinstance(cmd, dict) and 'provider' in cmd:
+                    providers_used.add(cmd['provider'])
 
+    return config, providers_used
 
+
+@functools.lru_cache(maxsize=1)
 def check_ollama_installed() -> bool:
-    """Check if Ollama is installed"""
+    """Check if Ollama is installed (cached - invariant per process)"""
     try:
         result = subprocess.run(['ollama', '--version'],
                                 capture_output=True, text=True)
@@ -251,12 +299,36 @@ def check_ollama_installed() -> bool:
         return False
 
 
-def pull_ollama_model(model: str) -> bool:
-    """Pull an Ollama model if not present"""
+def list_installed_ollama_models() -> set:
+    """Get the set of locally installed Ollama model names"""
     try:
         result = subprocess.run(['ollama', 'list'],
                                 capture_output=True, text=True)
-        if model in result.stdout:
+        if result.returncode != 0:
+            return set()
+        # First column of each row after the header is the model name;
+        # index both 'name:tag' and the bare 'name'
+        models = set()
+        for line in result.stdout.splitlines()[1:]:
+            parts = line.split()
+            if parts:
+                models.add(parts[0])
+                models.add(parts[0].split(':')[0])
+        return models
+    except Exception:
+        return set()
+
+
+def pull_ollama_model(model: str, installed_models: Optional[set] = None) -> bool:
+    """Pull an Ollama model if not present
+
+    Pass installed_models (from list_installed_ollama_models) to avoid
+    re-running 'ollama list' for every model in a loop.
+    """
+    try:
+        if installed_models is None:
+            installed_models = list_installed_ollama_models()
+        if model in installed_models:
             return True
         print(f"Pulling Ollama model: {model}")
         result = subprocess.run(['ollama', 'pull', model],
@@ -278,13 +350,13 @@ def main():
 
     # Load configuration
     try:
-        config = load_config(args.config)
+        config, providers_used = load_config(args.config)
     except Exception as e:
         print(f"Error loading config: {e}")
         sys.exit(1)
 
     # Check Ollama installation
-    if args.pull_models or any('ollama' in str(window) for window in config.get('windows', [])):
+    if args.pull_models or any(p.startswith('ollama') for p in providers_used):
         if not check_ollama_installed():
             print("Ollama is not installed. Please install it from https://ollama.com/")
             sys.exit(1)
@@ -292,8 +364,10 @@ def main():
         # Pull required models if requested
         if args.pull_models:
             ollama_models = config.get('ollama_models', [])
+            # One 'ollama list' for the whole loop
+            installed_models = list_installed_ollama_models()
             for model in ollama_models:
-                if not pull_ollama_model(model):
+                if not pull_ollama_model(model, installed_models):
                     print(f"Failed to pull model: {model}")
 
     # Determine session name
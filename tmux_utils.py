@@ -2,10 +2,14 @@
 
 import subprocess
 import json
+import select
+import shlex
+import threading
 import time
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from collections import OrderedDict
 
 @dataclass
 class TmuxWindow:
@@ -20,12 +24,143 @@ class TmuxSession:
     windows: List[TmuxWindow]
     attached: bool
 
+class TmuxControlClient:
+    """Long-lived tmux control-mode (-C) pipe.
+
+    Every one-shot ``tmux`` invocation forks a new client that reconnects
+    to the tmux server. This keeps a single control-mode client open and
+    streams commands over its stdin, reading %begin/%end framed replies.
+    Callers fall back to one-shot subprocesses when control mode is
+    unavailable (no server running, client died, etc).
+    """
+
+    REPLY_TIMEOUT = 5.0
+
+    def __init__(self):
+        self._proc = None
+        self._broken = False
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> bool:
+        if self._broken:
+            return False
+        if self._proc is not None and self._proc.poll() is None:
+            return True
+        try:
+            # Attach to the most recent session; if no server/session is
+            # up yet, callers fall back to one-shot tmux commands
+            self._proc = subprocess.Popen(
+                ["tmux", "-C", "attach-session"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+            self._buffer.clear()
+            # Consume the reply block the attach itself produces
+            ok, _ = self._read_reply()
+            if ok is None:
+                self._shutdown()
+                return False
+            return True
+        except Exception:
+            self._proc = None
+            return False
+
+    def _read_line(self, deadline: float) -> Optional[str]:
+        """Read one line from the unbuffered pipe, honoring the deadline"""
+        while True:
+            newline = self._buffer.find(b'\n')
+            if newline != -1:
+                line = bytes(self._buffer[:newline])
+                del self._buffer[:newline + 1]
+                return line.decode('utf-8', errors='replace')
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([self._proc.stdout], [], [], remaining)
+            if not ready:
+                return None
+            chunk = self._proc.stdout.read(4096)
+            if not chunk:
+                return None
+            self._buffer.extend(chunk)
+
+    def _read_reply(self):
+        """Read one %begin...%end/%error block, skipping notifications."""
+        output_lines = []
+        in_block = False
+        deadline = time.time() + self.REPLY_TIMEOUT
+        while True:
+            line = self._read_line(deadline)
+            if line is None:
+                return None, None
+            if line.startswith('%begin'):
+                in_block = True
+                output_lines = []
+            elif line.startswith('%end'):
+                return True, '\n'.join(output_lines)
+            elif line.startswith('%error'):
+                return False, '\n'.join(output_lines)
+            elif in_block:
+                output_lines.append(line)
+            # Lines outside a block are async notifications - ignored
+
+    def _shutdown(self):
+        if self._proc is not None:
+            try:
+                self._proc.kill()
+            except Exception:
+                pass
+            self._proc = None
+
+    def run(self, args: List[str]):
+        """Run a tmux command over the control pipe.
+
+        Returns (ok, output); (None, None) means the control path is
+        unavailable and the caller should fall back to a subprocess.
+        """
+        # The protocol is line-based; embedded newlines need a subprocess
+        if any('\n' in arg for arg in args):
+            return None, None
+        with self._lock:
+            if not self._ensure_started():
+                return None, None
+            try:
+                command = ' '.join(shlex.quote(arg) for arg in args)
+                self._proc.stdin.write(command.encode('utf-8') + b'\n')
+                self._proc.stdin.flush()
+                ok, output = self._read_reply()
+            except Exception:
+                ok = None
+            if ok is None:
+                # Timed out or pipe broke - drop the client and fall back
+                self._shutdown()
+                self._broken = True
+                return None, None
+            return ok, output
+
 class TmuxOrchestrator:
     def __init__(self):
         self.safety_mode = True
         self.max_lines_capture = 1000
         self._session_registry = set()
+        self._control = TmuxControlClient()
         self._load_existing_sessions()
+
+    def _run_tmux(self, args: List[str], check: bool = False) -> subprocess.CompletedProcess:
+        """Run a tmux command, preferring the persistent control-mode pipe"""
+        ok, output = self._control.run(args)
+        if ok is not None:
+            if not ok and check:
+                raise subprocess.CalledProcessError(1, ["tmux"] + args, output=output)
+            return subprocess.CompletedProcess(
+                ["tmux"] + args, 0 if ok else 1, stdout=output, stderr=''
+            )
+        # close_fds=False keeps the one-shot fallback on posix_spawn
+        return subprocess.run(["tmux"] + args, capture_output=True, text=True,
+                              check=check, close_fds=False)
     
     def _load_existing_sessions(self):
         """Load existing tmux sessions into registry to preserve them"""
@@ -41,39 +176,34 @@ class TmuxOrchestrator:
     def get_tmux_sessions(self) -> List[TmuxSession]:
         """Get all tmux sessions and their windows"""
         try:
-            # Get sessions
-            sessions_cmd = ["tmux", "list-sessions", "-F", "#{session_name}:#{session_attached}"]
-            sessions_result = subprocess.run(sessions_cmd, capture_output=True, text=True, check=True)
-            
-            sessions = []
-            for line in sessions_result.stdout.strip().split('\n'):
+            # One call for every window in every session - avoids a
+            # list-windows subprocess per session
+            fmt = "#{session_name}|#{session_attached}|#{window_index}|#{window_name}|#{window_active}"
+            result = self._run_tmux(["list-windows", "-a", "-F", fmt], check=True)
+
+            sessions: "OrderedDict[str, TmuxSession]" = OrderedDict()
+            for line in result.stdout.strip().split('\n'):
                 if not line:
                     continue
-                session_name, attached = line.split(':')
-                
-                # Get windows for this session
-                windows_cmd = ["tmux", "list-windows", "-t", session_name, "-F", "#{window_index}:#{window_name}:#{window_active}"]
-                windows_result = subprocess.run(windows_cmd, capture_output=True, text=True, check=True)
-                
-                windows = []
-                for window_line in windows_result.stdout.strip().split('\n'):
-                    if not window_line:
-                        continue
-                    window_index, window_name, window_active = window_line.split(':')
-                    windows.append(TmuxWindow(
-                        session_name=session_name,
-                        window_index=int(window_index),
-                        window_name=window_name,
-                        active=window_active == '1'
-                    ))
-                
-                sessions.append(TmuxSession(
-                    name=session_name,
-                    windows=windows,
-                    attached=attached == '1'
+                session_name, attached, window_index, window_name, window_active = line.split('|', 4)
+
+                session = sessions.get(session_name)
+                if session is None:
+                    session = TmuxSession(
+                        name=session_name,
+                        windows=[],
+                        attached=attached == '1'
+                    )
+                    sessions[session_name] = session
+
+                session.windows.append(TmuxWindow(
+                    session_name=session_name,
+                    window_index=int(window_index),
+                    window_name=window_name,
+                    active=window_active == '1'
                 ))
-            
-            return sessions
+
+            return list(sessions.values())
         except subprocess.CalledProcessError as e:
             print(f"Error getting tmux sessions: {e}")
             return []
@@ -84,8 +214,8 @@ class TmuxOrchestrator:
             num_lines = self.max_lines_capture
             
         try:
-            cmd = ["tmux", "capture-pane", "-t", f"{session_name}:{window_index}", "-p", "-S", f"-{num_lines}"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            cmd = ["capture-pane", "-t", f"{session_name}:{window_index}", "-p", "-S", f"-{num_lines}"]
+            result = self._run_tmux(cmd, check=True)
             return result.stdout
         except subprocess.CalledProcessError as e:
             return f"Error capturing window content: {e}"
@@ -93,9 +223,9 @@ class TmuxOrchestrator:
     def get_window_info(self, session_name: str, window_index: int) -> Dict:
         """Get detailed information about a specific window"""
         try:
-            cmd = ["tmux", "display-message", "-t", f"{session_name}:{window_index}", "-p", 
+            cmd = ["display-message", "-t", f"{session_name}:{window_index}", "-p",
                    "#{window_name}:#{window_active}:#{window_panes}:#{window_layout}"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = self._run_tmux(cmd, check=True)
             
             if result.stdout.strip():
                 parts = result.stdout.strip().split(':')
@@ -123,8 +253,7 @@ class TmuxOrchestrator:
                 return False
         
         try:
-            cmd = ["tmux", "send-keys", "-t", f"{session_name}:{window_index}", keys]
-            subprocess.run(cmd, check=True)
+            self._run_tmux(["send-keys", "-t", f"{session_name}:{window_index}", keys], check=True)
             return True
         except subprocess.CalledProcessError as e:
             print(f"Error sending keys: {e}")
@@ -137,8 +266,7 @@ class TmuxOrchestrator:
             return False
         # Then send the actual Enter key (C-m)
         try:
-            cmd = ["tmux", "send-keys", "-t", f"{session_name}:{window_index}", "C-m"]
-            subprocess.run(cmd, check=True)
+            self._run_tmux(["send-keys", "-t", f"{session_name}:{window_index}", "C-m"], check=True)
             return True
         except subprocess.CalledProcessError as e:
             print(f"Error sending Enter key: {e}")
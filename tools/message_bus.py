@@ -4,77 +4,191 @@ Message Bus for Inter-Agency Communication
 
 Handles routing and delivery of messages between agencies,
 maintains message queue, and ensures reliable delivery.
+
+The queue is backed by SQLite (WAL mode) with indexes on recipient,
+status, and timestamp, so sends are single INSERTs, status changes are
+single UPDATEs, and reads are indexed queries - no full-file rewrite or
+re-parse per operation. Legacy message_queue.json / message_queue.jsonl
+stores are imported into the database on first use.
 """
 
 import json
 import os
+import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """Decode JSON, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> str:
+    """Encode JSON compactly, preferring orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages(
+    id TEXT PRIMARY KEY,
+    ts REAL,
+    from_agency TEXT,
+    to_agency TEXT,
+    priority TEXT,
+    type TEXT,
+    payload TEXT,
+    status TEXT,
+    delivered_at REAL,
+    acknowledged_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_to_status ON messages(to_agency, status);
+CREATE INDEX IF NOT EXISTS idx_ts ON messages(ts);
+"""
+
+
+def _iso(ts: Optional[float]) -> Optional[str]:
+    """Epoch seconds to ISO string (None passes through)."""
+    return datetime.fromtimestamp(ts).isoformat() if ts is not None else None
+
+
+def _epoch(iso: Optional[str]) -> Optional[float]:
+    """ISO string to epoch seconds (None passes through)."""
+    return datetime.fromisoformat(iso).timestamp() if iso else None
+
+
+def _row_to_message(row: sqlite3.Row) -> Dict:
+    """Convert a database row to the message dict shape callers expect."""
+    return {
+        "id": row["id"],
+        "timestamp": _iso(row["ts"]),
+        "from_agency": row["from_agency"],
+        "to_agency": row["to_agency"],
+        "priority": row["priority"],
+        "type": row["type"],
+        "payload": _loads(row["payload"]),
+        "status": row["status"],
+        "delivered_at": _iso(row["delivered_at"]),
+        "acknowledged_at": _iso(row["acknowledged_at"])
+    }
+
+
 class MessageBus:
     """Central message routing and delivery system for agencies."""
 
     def __init__(self, registry_path: str = "registry"):
         self.registry_path = Path(registry_path)
-        self.queue_file = self.registry_path / "message_queue.json"
+        self.db_file = self.registry_path / "messages.db"
         self.agencies_file = self.registry_path / "active_agencies.json"
 
-    def _load_queue(self) -> Dict:
-        """Load message queue from file."""
-        if not self.queue_file.exists():
-            return {"messages": [], "last_updated": None, "version": "1.0"}
-        with open(self.queue_file, 'r') as f:
-            return json.load(f)
-
-    def _save_queue(self, queue: Dict):
-        """Save message queue to file."""
-        queue["last_updated"] = datetime.now().isoformat()
-        with open(self.queue_file, 'w') as f:
-            json.dump(queue, f, indent=2)
+        self.registry_path.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_file), isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._agencies_cache = None
+        self._agencies_mtime = -1
+        self._migrate_legacy_stores()
+
+    def _insert_message(self, msg: Dict):
+        """Insert one message dict (legacy shape) into the database."""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO messages VALUES (?,?,?,?,?,?,?,?,?,?)",
+            (msg["id"], _epoch(msg.get("timestamp")) or time.time(),
+             msg["from_agency"], msg["to_agency"], msg.get("priority", "medium"),
+             msg["type"], _dumps(msg.get("payload", {})),
+             msg.get("status", "pending"), _epoch(msg.get("delivered_at")),
+             _epoch(msg.get("acknowledged_at")))
+        )
+
+    def _migrate_legacy_stores(self):
+        """One-time import of the old JSON/JSONL queue files."""
+        legacy_log = self.registry_path / "message_queue.jsonl"
+        legacy_json = self.registry_path / "message_queue.json"
+        for path in (legacy_json, legacy_log):
+            if not path.exists():
+                continue
+            try:
+                with open(path, 'r') as f:
+                    if path.suffix == '.jsonl':
+                        records = [json.loads(line) for line in f if line.strip()]
+                    else:
+                        records = json.load(f).get("messages", [])
+                for record in records:
+                    if record.get("op") == "status":
+                        self.conn.execute(
+                            "UPDATE messages SET status=?, delivered_at=COALESCE(?, delivered_at),"
+                            " acknowledged_at=COALESCE(?, acknowledged_at) WHERE id=?",
+                            (record["status"],
+                             _epoch(record["at"]) if record["status"] == "delivered" else None,
+                             _epoch(record["at"]) if record["status"] == "acknowledged" else None,
+                             record["id"])
+                        )
+                    else:
+                        self._insert_message(record)
+                os.replace(path, path.with_suffix(path.suffix + '.imported'))
+            except (OSError, ValueError):
+                continue
 
     def _load_agencies(self) -> Dict:
-        """Load active agencies from registry."""
-        if not self.agencies_file.exists():
+        """Load active agencies, re-parsing only when the file changed."""
+        try:
+            mtime = self.agencies_file.stat().st_mtime_ns
+        except OSError:
             return {"agencies": [], "last_updated": None, "version": "1.0"}
-        with open(self.agencies_file, 'r') as f:
-            return json.load(f)
+        if self._agencies_cache is None or mtime != self._agencies_mtime:
+            self._agencies_cache = _loads(self.agencies_file.read_bytes())
+            self._agencies_mtime = mtime
+        return self._agencies_cache
 
     def send_message(self, from_agency: str, to_agency: str,
-                    msg_type: str, payload: Dict, priority: str = "medium") -> str:
+                    msg_type: str, payload: Dict, priority: str = "medium",
+                    durable: bool = False) -> str:
         """
         Send a message from one agency to another.
 
+        With synchronous=NORMAL the WAL is fsynced in groups at checkpoint
+        time, so the fast path pays no per-message sync. Pass durable=True
+        for messages that must survive a power loss before this returns;
+        that forces a full WAL checkpoint, which waits out concurrent
+        readers and syncs this send and everything batched before it.
+
         Args:
             from_agency: Source agency name
             to_agency: Destination agency name
             msg_type: Type of message (handoff, request, response, alert, broadcast)
             payload: Message payload (dict)
             priority: Message priority (high, medium, low)
+            durable: Block until the message is fsynced to disk
 
         Returns:
             Message ID
         """
-        queue = self._load_queue()
-
         msg_id = f"msg-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
 
-        message = {
-            "id": msg_id,
-            "timestamp": datetime.now().isoformat(),
-            "from_agency": from_agency,
-            "to_agency": to_agency,
-            "priority": priority,
-            "type": msg_type,
-            "payload": payload,
-            "status": "pending",
-            "delivered_at": None,
-            "acknowledged_at": None
-        }
-
-        queue["messages"].append(message)
-        self._save_queue(queue)
+        self.conn.execute(
+            "INSERT INTO messages VALUES (?,?,?,?,?,?,?,?,?,?)",
+            (msg_id, time.time(), from_agency, to_agency, priority,
+             msg_type, _dumps(payload), "pending", None, None)
+        )
+        if durable:
+            # FULL blocks until every WAL frame is checkpointed and the
+            # database is synced; PASSIVE can return with the insert
+            # still unsynced when another connection holds a snapshot
+            self.conn.execute("PRAGMA wal_checkpoint(FULL)")
 
         print(f"✓ Message {msg_id} sent from {from_agency} to {to_agency}")
         return msg_id
@@ -90,36 +204,54 @@ class MessageBus:
         Returns:
             List of messages
         """
-        queue = self._load_queue()
-        messages = [
-            msg for msg in queue["messages"]
-            if msg["to_agency"] == agency
-        ]
-
         if status:
-            messages = [msg for msg in messages if msg["status"] == status]
+            rows = self.conn.execute(
+                "SELECT * FROM messages WHERE to_agency=? AND status=? ORDER BY ts",
+                (agency, status)
+            )
+        else:
+            rows = self.conn.execute(
+                "SELECT * FROM messages WHERE to_agency=? ORDER BY ts", (agency,)
+            )
+        return [_row_to_message(row) for row in rows]
+
+    def pop_next(self, agency: str) -> Optional[Dict]:
+        """
+        Take the next pending message for an agency in dispatch order.
+
+        Highest priority first (high > medium > low), oldest first within
+        a priority. The message is marked delivered before being returned,
+        so repeated calls drain the queue.
 
-        return messages
+        Returns:
+            Message dict, or None when nothing is pending
+        """
+        row = self.conn.execute(
+            "SELECT * FROM messages WHERE to_agency=? AND status='pending'"
+            " ORDER BY CASE priority WHEN 'high' THEN 0 WHEN 'medium' THEN 1"
+            " ELSE 2 END, ts LIMIT 1",
+            (agency,)
+        ).fetchone()
+        if row is None:
+            return None
+        self.mark_delivered(row["id"])
+        msg = _row_to_message(row)
+        msg["status"] = "delivered"
+        return msg
 
     def mark_delivered(self, msg_id: str):
         """Mark a message as delivered."""
-        queue = self._load_queue()
-        for msg in queue["messages"]:
-            if msg["id"] == msg_id:
-                msg["status"] = "delivered"
-                msg["delivered_at"] = datetime.now().isoformat()
-                break
-        self._save_queue(queue)
+        self.conn.execute(
+            "UPDATE messages SET status='delivered', delivered_at=? WHERE id=?",
+            (time.time(), msg_id)
+        )
 
     def mark_acknowledged(self, msg_id: str):
         """Mark a message as acknowledged."""
-        queue = self._load_queue()
-        for msg in queue["messages"]:
-            if msg["id"] == msg_id:
-                msg["status"] = "acknowledged"
-                msg["acknowledged_at"] = datetime.now().isoformat()
-                break
-        self._save_queue(queue)
+        self.conn.execute(
+            "UPDATE messages SET status='acknowledged', acknowledged_at=? WHERE id=?",
+            (time.time(), msg_id)
+        )
 
     def broadcast(self, from_agency: str, msg_type: str, payload: Dict, priority: str = "high") -> List[str]:
         """
@@ -129,43 +261,78 @@ class MessageBus:
             List of message IDs
         """
         agencies_data = self._load_agencies()
-        active_agencies = [a["name"] for a in agencies_data["agencies"]]
-
-        msg_ids = []
-        for agency in active_agencies:
-            if agency != from_agency:  # Don't send to self
-                msg_id = self.send_message(from_agency, agency, msg_type, payload, priority)
-                msg_ids.append(msg_id)
-
-        print(f"✓ Broadcast sent to {len(msg_ids)} agencies")
-        return msg_ids
+        recipients = [a["name"] for a in agencies_data["agencies"]
+                      if a["name"] != from_agency]  # Don't send to self
+
+        # One transaction and one executemany for all recipients - the
+        # payload is encoded once and N inserts hit the journal together
+        now = time.time()
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        encoded = _dumps(payload)
+        rows = [(f"msg-{stamp}-{uuid.uuid4().hex[:6]}", now, from_agency,
+                 agency, priority, msg_type, encoded, "pending", None, None)
+                for agency in recipients]
+        self.conn.execute("BEGIN")
+        self.conn.executemany("INSERT INTO messages VALUES (?,?,?,?,?,?,?,?,?,?)", rows)
+        self.conn.execute("COMMIT")
+
+        print(f"✓ Broadcast sent to {len(rows)} agencies")
+        return [row[0] for row in rows]
 
     def get_pending_count(self, agency: str) -> int:
         """Get count of pending messages for an agency."""
-        return len(self.get_messages(agency, status="pending"))
+        row = self.conn.execute(
+            "SELECT COUNT(*) FROM messages WHERE to_agency=? AND status='pending'",
+            (agency,)
+        ).fetchone()
+        return row[0]
+
+    def queue_stats(self) -> Dict:
+        """Get per-status message counts in one indexed query."""
+        counts = {
+            row[0]: row[1] for row in self.conn.execute(
+                "SELECT status, COUNT(*) FROM messages GROUP BY status"
+            )
+        }
+        last = self.conn.execute(
+            "SELECT MAX(MAX(ts), MAX(COALESCE(delivered_at, 0)),"
+            " MAX(COALESCE(acknowledged_at, 0))) FROM messages"
+        ).fetchone()[0]
+        return {
+            "total_messages": sum(counts.values()),
+            "pending": counts.get("pending", 0),
+            "delivered": counts.get("delivered", 0),
+            "acknowledged": counts.get("acknowledged", 0),
+            "last_updated": _iso(last) if last else None
+        }
 
-    def clear_old_messages(self, days: int = 7):
-        """Clear messages older than specified days."""
-        queue = self._load_queue()
-        cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
+    def compact(self):
+        """Fold the write-ahead log back into the database and reclaim space.
 
-        queue["messages"] = [
-            msg for msg in queue["messages"]
-            if datetime.fromisoformat(msg["timestamp"]).timestamp() > cutoff
-        ]
+        Writes land in the WAL (append-only); this checkpoints it into the
+        main file and VACUUMs pages freed by cleared messages.
+        """
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self.conn.execute("VACUUM")
+        print("✓ Queue compacted")
 
-        self._save_queue(queue)
+    def clear_old_messages(self, days: int = 7):
+        """Clear messages older than specified days."""
+        cutoff = time.time() - (days * 24 * 60 * 60)
+        self.conn.execute("DELETE FROM messages WHERE ts <= ?", (cutoff,))
         print(f"✓ Cleared messages older than {days} days")
 
     def show_message(self, msg_id: str):
         """Display a message in formatted output."""
-        queue = self._load_queue()
-        msg = next((m for m in queue["messages"] if m["id"] == msg_id), None)
+        row = self.conn.execute(
+            "SELECT * FROM messages WHERE id=?", (msg_id,)
+        ).fetchone()
 
-        if not msg:
+        if not row:
             print(f"Message {msg_id} not found")
             return
 
+        msg = _row_to_message(row)
         print(f"\n{'='*60}")
         print(f"Message ID: {msg['id']}")
         print(f"From: {msg['from_agency']} → To: {msg['to_agency']}")
@@ -188,6 +355,8 @@ def main():
         print("  message_bus.py show <msg_id>")
         print("  message_bus.py broadcast <from> <type> <payload_json> [priority]")
         print("  message_bus.py pending <agency>")
+        print("  message_bus.py pop <agency>")
+        print("  message_bus.py compact")
         print("  message_bus.py deliver <msg_id>")
         print("  message_bus.py ack <msg_id>")
         sys.exit(1)
@@ -229,6 +398,17 @@ def main():
         count = bus.get_pending_count(agency)
         print(f"{agency} has {count} pending messages")
 
+    elif command == "pop":
+        agency = sys.argv[2]
+        msg = bus.pop_next(agency)
+        if msg:
+            bus.show_message(msg["id"])
+        else:
+            print(f"No pending messages for {agency}")
+
+    elif command == "compact":
+        bus.compact()
+
     elif command == "deliver":
         msg_id = sys.argv[2]
         bus.mark_delivered(msg_id)
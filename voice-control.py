@@ -6,94 +6,159 @@ Speak naturally, AI interprets intent and executes commands
 
 import subprocess
 import json
+import re
 import sys
-import time
 from pathlib import Path
 
-def execute_command(command_type, params):
-    """Execute orchestrator commands based on interpreted intent"""
+# Intent keyword alternations compiled once at import - each check is a
+# single scan of the transcription instead of one substring search per
+# keyword
+STATUS_RE = re.compile(r"status|what's happening|check on|how is")
+LIST_RE = re.compile(r"list|show sessions|what's running")
+AGENCY_RE = re.compile(r"\b(\w+)\s+agency\b")
+AGENCY_ALIASES = {"qa": "QAAgency", "security": "SecurityAgency", "devops": "DevOpsAgency"}
+# Longest-first, so "tell the orchestrator" is stripped before "orchestrator"
+COMMAND_PHRASES = ("tell the orchestrator", "tell orchestrator", "send to orchestrator", "orchestrator")
+
+# One long-lived control-mode pipe to the tmux server; tmux operations
+# below reuse it instead of forking a client per call
+try:
+    from tmux_utils import TmuxControlClient
+    _control = TmuxControlClient()
+except ImportError:
+    _control = None
+
+
+def _tmux_run(args):
+    """Run a tmux command, preferring the control pipe.
+
+    Returns (ok, output); falls back to a one-shot subprocess when
+    control mode is unavailable.
+    """
+    if _control is not None:
+        ok, output = _control.run(args)
+        if ok is not None:
+            return ok, output
+    result = subprocess.run(['tmux'] + args, capture_output=True, text=True)
+    return result.returncode == 0, result.stdout
+
+def _do_send_message(params):
+    target = params.get("target", "orchestrator:0")
+    message = params.get("message", "")
+
+    if not message:
+        return {"error": "No message provided"}
+
+    if _control is not None:
+        ok, _ = _control.run(['send-keys', '-l', '-t', target, '--', message])
+        if ok is not None:
+            if ok:
+                ok, _ = _control.run(['send-keys', '-t', target, 'Enter'])
+            if not ok:
+                return {"error": f"Failed to send message to {target}"}
+            return {"success": True, "action": f"Sent message to {target}"}
 
-    if command_type == "send_message":
-        target = params.get("target", "orchestrator:0")
-        message = params.get("message", "")
+    try:
+        # Send message and Enter in one tmux invocation - keys are
+        # queued in order, so no settle delay is needed
+        subprocess.run(
+            ['tmux',
+             'send-keys', '-l', '-t', target, '--', message,
+             ';', 'send-keys', '-t', target, 'Enter'],
+            check=True
+        )
+        return {"success": True, "action": f"Sent message to {target}"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _do_create_agency(params):
+    name = params.get("name", "")
+    agents = params.get("agents", [])
+    capabilities = params.get("capabilities", [])
+
+    if not name:
+        return {"error": "Agency name required"}
+
+    agent_str = ",".join(agents) if agents else ""
+    cap_str = ",".join(capabilities) if capabilities else ""
+
+    cmd = ["./scripts/create_agency.sh", name]
+    if agent_str:
+        cmd.extend(["--agents", agent_str])
+    if cap_str:
+        cmd.extend(["--capabilities", cap_str])
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return {"success": True, "action": f"Created agency {name}", "output": result.stdout}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _do_check_status(params):
+    target = params.get("target", "orchestrator:0")
+
+    try:
+        # tmux trims to the last 30 lines itself - no transferring
+        # the whole scrollback just to slice it here
+        ok, output = _tmux_run(['capture-pane', '-t', target, '-p', '-S', '-30'])
+        if not ok:
+            return {"error": f"Could not capture {target}"}
+        return {"success": True, "status": output.strip()}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _do_list_sessions(params):
+    try:
+        ok, output = _tmux_run(['list-sessions'])
+        if ok:
+            return {"success": True, "sessions": output.strip()}
+        return {"success": True, "sessions": "No sessions running"}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _do_start_orchestrator(params):
+    try:
+        result = subprocess.run(['./start-orchestrator.sh'], capture_output=True, text=True, check=True)
+        return {"success": True, "action": "Started orchestrator", "output": result.stdout}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _do_message_bus(params):
+    action = params.get("action", "pending")
+    agency = params.get("agency", "CodeAgency")
+
+    cmd = ["python3", "tools/message_bus.py", action, agency]
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        return {"success": True, "output": result.stdout}
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _do_unknown(params):
+    return {"error": "Unknown command type"}
 
-        if not message:
-            return {"error": "No message provided"}
 
-        try:
-            # Send message using tmux
-            subprocess.run(['tmux', 'send-keys', '-t', target, message], check=True)
-            time.sleep(0.3)
-            subprocess.run(['tmux', 'send-keys', '-t', target, 'Enter'], check=True)
-            return {"success": True, "action": f"Sent message to {target}"}
-        except Exception as e:
-            return {"error": str(e)}
-
-    elif command_type == "create_agency":
-        name = params.get("name", "")
-        agents = params.get("agents", [])
-        capabilities = params.get("capabilities", [])
-
-        if not name:
-            return {"error": "Agency name required"}
-
-        agent_str = ",".join(agents) if agents else ""
-        cap_str = ",".join(capabilities) if capabilities else ""
-
-        cmd = ["./scripts/create_agency.sh", name]
-        if agent_str:
-            cmd.extend(["--agents", agent_str])
-        if cap_str:
-            cmd.extend(["--capabilities", cap_str])
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return {"success": True, "action": f"Created agency {name}", "output": result.stdout}
-        except Exception as e:
-            return {"error": str(e)}
-
-    elif command_type == "check_status":
-        target = params.get("target", "orchestrator:0")
-
-        try:
-            result = subprocess.run(
-                ['tmux', 'capture-pane', '-t', target, '-p'],
-                capture_output=True, text=True, check=True
-            )
-            lines = result.stdout.strip().split('\n')[-30:]
-            return {"success": True, "status": "\n".join(lines)}
-        except Exception as e:
-            return {"error": str(e)}
-
-    elif command_type == "list_sessions":
-        try:
-            result = subprocess.run(['tmux', 'ls'], capture_output=True, text=True)
-            if result.returncode == 0:
-                return {"success": True, "sessions": result.stdout.strip()}
-            return {"success": True, "sessions": "No sessions running"}
-        except Exception as e:
-            return {"error": str(e)}
-
-    elif command_type == "start_orchestrator":
-        try:
-            result = subprocess.run(['./start-orchestrator.sh'], capture_output=True, text=True, check=True)
-            return {"success": True, "action": "Started orchestrator", "output": result.stdout}
-        except Exception as e:
-            return {"error": str(e)}
-
-    elif command_type == "message_bus":
-        action = params.get("action", "pending")
-        agency = params.get("agency", "CodeAgency")
-
-        cmd = ["python3", "tools/message_bus.py", action, agency]
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return {"success": True, "output": result.stdout}
-        except Exception as e:
-            return {"error": str(e)}
+# O(1) dispatch instead of re-testing command_type down an elif chain
+DISPATCH = {
+    "send_message": _do_send_message,
+    "create_agency": _do_create_agency,
+    "check_status": _do_check_status,
+    "list_sessions": _do_list_sessions,
+    "start_orchestrator": _do_start_orchestrator,
+    "message_bus": _do_message_bus,
+}
 
-    return {"error": "Unknown command type"}
+
+def execute_command(command_type, params):
+    """Execute orchestrator commands based on interpreted intent"""
+    return DISPATCH.get(command_type, _do_unknown)(params)
 
 
 def interpret_intent(transcription):
@@ -105,33 +170,25 @@ def interpret_intent(transcription):
     text = transcription.lower()
 
     # Status checks
-    if any(word in text for word in ["status", "what's happening", "check on", "how is"]):
+    if STATUS_RE.search(text):
         if "codeagency" in text:
             return ("check_status", {"target": "CodeAgency:0"})
         return ("check_status", {"target": "orchestrator:0"})
 
     # List sessions
-    if any(word in text for word in ["list", "show sessions", "what's running"]):
+    if LIST_RE.search(text):
         return ("list_sessions", {})
 
     # Create agency
     if "create" in text and "agency" in text:
-        # Extract agency name (simple heuristic)
-        words = text.split()
-        name = None
-        for i, word in enumerate(words):
-            if word == "agency" and i > 0:
-                name = words[i-1].title() + "Agency"
-                break
-
-        if not name and "qa" in text:
-            name = "QAAgency"
-        elif not name and "security" in text:
-            name = "SecurityAgency"
-        elif not name and "devops" in text:
-            name = "DevOpsAgency"
-
-        return ("create_agency", {"name": name or "NewAgency", "agents": [], "capabilities": []})
+        # One regex capture for "<name> agency", aliases for shortcuts
+        match = AGENCY_RE.search(text)
+        if match:
+            name = match.group(1).title() + "Agency"
+        else:
+            name = next((v for k, v in AGENCY_ALIASES.items() if k in text), "NewAgency")
+
+        return ("create_agency", {"name": name, "agents": [], "capabilities": []})
 
     # Start orchestrator
     if "start" in text and "orchestrator" in text:
@@ -144,7 +201,7 @@ def interpret_intent(transcription):
     # Send message (default)
     # Remove common command phrases to get the actual message
     message = transcription
-    for phrase in ["tell the orchestrator", "tell orchestrator", "send to orchestrator", "orchestrator"]:
+    for phrase in COMMAND_PHRASES:
         message = message.replace(phrase, "").strip()
 
     target = "orchestrator:0"
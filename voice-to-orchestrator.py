@@ -11,48 +11,74 @@ import os
 
 ORCHESTRATOR_TARGET = "orchestrator:0"
 
+# One long-lived control-mode pipe to the tmux server; every send then
+# skips the fork+exec+handshake of a fresh tmux client
+try:
+    from tmux_utils import TmuxControlClient
+    _control = TmuxControlClient()
+except ImportError:
+    _control = None
+
+
+# Session presence rarely changes mid-loop; probe tmux once and only
+# re-probe after a failed send suggests the session went away
+_session_ok = None
+
+
 def send_to_orchestrator(message):
     """Send message directly to orchestrator Claude in tmux"""
+    global _session_ok
+    if _control is not None:
+        ok, _ = _control.run(['send-keys', '-l', '-t', ORCHESTRATOR_TARGET, '--', message])
+        if ok is not None:
+            if not ok:
+                _session_ok = None
+                print("❌ Failed to send to orchestrator")
+                return False
+            ok, _ = _control.run(['send-keys', '-t', ORCHESTRATOR_TARGET, 'Enter'])
+            return bool(ok)
     try:
-        # Send the message
-        subprocess.run(
-            ['tmux', 'send-keys', '-t', ORCHESTRATOR_TARGET, message],
-            check=True,
-            capture_output=True
-        )
-        time.sleep(0.3)
-
-        # Press Enter
+        # One invocation delivers the message and the Enter key; tmux
+        # queues keys in order, so no settle delay is needed
         subprocess.run(
-            ['tmux', 'send-keys', '-t', ORCHESTRATOR_TARGET, 'Enter'],
+            ['tmux',
+             'send-keys', '-l', '-t', ORCHESTRATOR_TARGET, '--', message,
+             ';', 'send-keys', '-t', ORCHESTRATOR_TARGET, 'Enter'],
             check=True,
             capture_output=True
         )
 
         return True
     except subprocess.CalledProcessError as e:
+        _session_ok = None
         print(f"❌ Failed to send to orchestrator: {e.stderr.decode()}")
         return False
 
 
 def check_orchestrator_running():
-    """Check if orchestrator session exists"""
+    """Check if orchestrator session exists (cached between sends)"""
+    global _session_ok
+    if _session_ok is not None:
+        return _session_ok
     try:
         result = subprocess.run(
             ['tmux', 'has-session', '-t', 'orchestrator'],
             capture_output=True
         )
-        return result.returncode == 0
+        _session_ok = result.returncode == 0
     except Exception:
-        return False
+        _session_ok = False
+    return _session_ok
 
 
 def start_orchestrator():
     """Start orchestrator if not running"""
+    global _session_ok
     print("🚀 Starting orchestrator...")
     try:
         subprocess.run(['./start-orchestrator.sh'], check=True)
         time.sleep(2)
+        _session_ok = None  # Re-probe now that the session may exist
         return True
     except Exception as e:
         print(f"❌ Failed to start orchestrator: {e}")
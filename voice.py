@@ -4,8 +4,8 @@ Simple voice interface to orchestrator
 Uses Google Speech Recognition (requires internet) or offline options
 """
 
+import asyncio
 import subprocess
-import time
 import sys
 
 try:
@@ -14,38 +14,131 @@ try:
 except ImportError:
     HAS_SR = False
 
+# Local Whisper (CTranslate2, int8) transcribes on-device in ~200ms -
+# no network round-trip or rate limits. Falls back to Google STT.
+try:
+    from faster_whisper import WhisperModel
+    HAS_WHISPER = True
+except ImportError:
+    HAS_WHISPER = False
+
+_whisper_model = None
+
+EXIT_WORDS = ('stop listening', 'exit', 'quit')
+
+
+def _get_whisper_model():
+    """Load the local Whisper model once, on first use"""
+    global _whisper_model
+    if _whisper_model is None:
+        print("🔧 Loading local Whisper model (small.en, int8)...")
+        _whisper_model = WhisperModel("small.en", device="cpu", compute_type="int8")
+    return _whisper_model
+
+# One long-lived control-mode pipe to the tmux server; every send then
+# skips the fork+exec+handshake of a fresh tmux client
+try:
+    from tmux_utils import TmuxControlClient
+    _control = TmuxControlClient()
+except ImportError:
+    _control = None
+
 
 def send_to_orchestrator(text):
     """Send transcribed text directly to orchestrator"""
+    if _control is not None:
+        ok, _ = _control.run(['send-keys', '-l', '-t', 'orchestrator:0', '--', text])
+        if ok is not None:
+            if not ok:
+                return False
+            ok, _ = _control.run(['send-keys', '-t', 'orchestrator:0', 'Enter'])
+            return bool(ok)
     try:
-        subprocess.run(['tmux', 'send-keys', '-t', 'orchestrator:0', text], check=True)
-        time.sleep(0.3)
-        subprocess.run(['tmux', 'send-keys', '-t', 'orchestrator:0', 'Enter'], check=True)
+        # One invocation delivers the text and the Enter key; tmux queues
+        # keys in order, so no settle delay is needed
+        subprocess.run(
+            ['tmux',
+             'send-keys', '-l', '-t', 'orchestrator:0', '--', text,
+             ';', 'send-keys', '-t', 'orchestrator:0', 'Enter'],
+            check=True
+        )
         return True
     except:
         return False
 
 
-def listen_once_google():
-    """Listen for one voice command using Google Speech Recognition"""
-    r = sr.Recognizer()
+def transcribe(r, audio):
+    """Transcribe audio locally with Whisper when installed, else Google"""
+    if HAS_WHISPER:
+        import io
+        segments, _ = _get_whisper_model().transcribe(
+            io.BytesIO(audio.get_wav_data()), beam_size=1, vad_filter=True
+        )
+        return ' '.join(seg.text.strip() for seg in segments).strip() or None
+    return r.recognize_google(audio)
 
-    with sr.Microphone() as source:
+
+async def _capture_loop(r, source, queue):
+    """Producer: capture the next utterance while the last one is processed"""
+    loop = asyncio.get_running_loop()
+    while True:
         print("🎤 Listening... (speak now)")
-        r.adjust_for_ambient_noise(source, duration=0.5)
-        audio = r.listen(source)
+        while True:
+            # A 1s wait timeout keeps the executor thread from blocking
+            # on the microphone indefinitely; without it, cancelling the
+            # producer on exit would leave asyncio.run's executor
+            # shutdown joined to a listen() that never returns in silence
+            try:
+                audio = await loop.run_in_executor(None, r.listen, source, 1)
+                break
+            except sr.WaitTimeoutError:
+                continue
+        await queue.put(audio)
 
-    print("🔄 Processing...")
 
+async def _dispatch_loop(r, queue):
+    """Consumer: transcribe and forward while the microphone keeps capturing"""
+    loop = asyncio.get_running_loop()
+    while True:
+        audio = await queue.get()
+        print("🔄 Processing...")
+
+        try:
+            text = await loop.run_in_executor(None, transcribe, r, audio)
+        except sr.UnknownValueError:
+            print("❌ Could not understand audio")
+            continue
+        except sr.RequestError as e:
+            print(f"❌ Error: {e}")
+            continue
+
+        if not text:
+            print("❌ Could not understand audio")
+            continue
+
+        print(f"📝 You said: \"{text}\"")
+
+        # Exit commands
+        if any(word in text.lower() for word in EXIT_WORDS):
+            print("👋 Stopping voice mode")
+            return
+
+        # Send to orchestrator
+        print("📤 Sending to orchestrator...")
+        if await loop.run_in_executor(None, send_to_orchestrator, text):
+            print("✅ Sent\n")
+        else:
+            print("❌ Failed to send\n")
+
+
+async def _listen_pipeline(r, source):
+    """Run capture and transcribe/send concurrently, linked by a queue"""
+    queue = asyncio.Queue(maxsize=2)
+    producer = asyncio.ensure_future(_capture_loop(r, source, queue))
     try:
-        text = r.recognize_google(audio)
-        return text
-    except sr.UnknownValueError:
-        print("❌ Could not understand audio")
-        return None
-    except sr.RequestError as e:
-        print(f"❌ Error: {e}")
-        return None
+        await _dispatch_loop(r, queue)
+    finally:
+        producer.cancel()
 
 
 def listen_continuous():
@@ -63,25 +156,14 @@ def listen_continuous():
         print("Start with: ./start-orchestrator.sh")
         return
 
-    while True:
-        text = listen_once_google()
-
-        if text:
-            print(f"📝 You said: \"{text}\"")
-
-            # Exit commands
-            if any(word in text.lower() for word in ['stop listening', 'exit', 'quit']):
-                print("👋 Stopping voice mode")
-                break
-
-            # Send to orchestrator
-            print("📤 Sending to orchestrator...")
-            if send_to_orchestrator(text):
-                print("✅ Sent\n")
-            else:
-                print("❌ Failed to send\n")
-
-        time.sleep(0.5)
+    # One recognizer and one open microphone for the whole session;
+    # ambient-noise calibration runs once instead of costing 500ms (and
+    # a device re-open) per utterance
+    r = sr.Recognizer()
+    with sr.Microphone() as source:
+        print("🔧 Calibrating for ambient noise...")
+        r.adjust_for_ambient_noise(source, duration=1.0)
+        asyncio.run(_listen_pipeline(r, source))
 
 
 def main():